@@ -0,0 +1,335 @@
+# cogs/dashboard.py
+
+import discord
+from discord.ext import commands, tasks
+from config import DASHBOARD_REFRESH_INTERVAL, DASHBOARD_IP_REFRESH_INTERVAL, DASHBOARD_STATE_FILE
+from cogs.games import build_status_embed
+import logging
+import asyncio
+import json
+import os
+import time
+from utils.server_info import get_external_ip, get_cpu_usage, get_memory_usage, IP_UNAVAILABLE
+
+# Discord allows 5 button rows; two games (start + stop) per row, last row for refresh
+MAX_DASHBOARD_GAMES = 8
+# Seconds to wait before retrying a dashboard the bot currently has no access to
+DASHBOARD_RETRY_BACKOFF = 600
+
+
+class InteractionDestination:
+    """Lets start_game/stop_game report progress through ephemeral followups of a deferred interaction."""
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content):
+        # wait=True returns a WebhookMessage so the progress bar can be edited in place
+        return await self.interaction.followup.send(content, ephemeral=True, wait=True)
+
+
+class DashboardButton(discord.ui.Button):
+    def __init__(self, dashboard, action, game_name=None, **kwargs):
+        custom_id = f"svinabot:dashboard:{action}" if game_name is None else f"svinabot:dashboard:{action}:{game_name}"
+        super().__init__(custom_id=custom_id, **kwargs)
+        self.dashboard = dashboard
+        self.action = action
+        self.game_name = game_name
+
+    async def callback(self, interaction):
+        # Acknowledge right away so Discord's 3 second window is met even for long start/stop runs
+        if self.action == 'refresh':
+            await interaction.response.defer()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+        await self.dashboard.handle_action(interaction, self.action, self.game_name)
+
+
+class DashboardView(discord.ui.View):
+    def __init__(self, dashboard, games):
+        # timeout=None and fixed custom_ids make the view persistent across bot restarts
+        super().__init__(timeout=None)
+        for index, game in enumerate(games[:MAX_DASHBOARD_GAMES]):
+            row = index // 2
+            self.add_item(DashboardButton(
+                dashboard, 'start', game.name,
+                label=f"Start {game.display_name}", style=discord.ButtonStyle.success, row=row
+            ))
+            self.add_item(DashboardButton(
+                dashboard, 'stop', game.name,
+                label=f"Stop {game.display_name}", style=discord.ButtonStyle.danger, row=row
+            ))
+        self.add_item(DashboardButton(
+            dashboard, 'refresh',
+            label="Refresh", emoji="🔄", style=discord.ButtonStyle.secondary, row=4
+        ))
+
+
+class Dashboard(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.dashboards = self.load_dashboards()
+        self.last_rendered = {}
+        self.retry_at = {}
+        self.snapshot = None
+        self.external_ip = None
+        self.external_ip_fetched_at = 0
+        self.refresh_lock = asyncio.Lock()
+
+    async def cog_load(self):
+        games = self.get_games()
+        if len(games) > MAX_DASHBOARD_GAMES:
+            logging.warning(f"Dashboard only shows buttons for the first {MAX_DASHBOARD_GAMES} games.")
+        # Register the persistent view so buttons on existing dashboards keep working after a restart
+        self.bot.add_view(DashboardView(self, games))
+        self.refresh_loop.start()
+
+    async def cog_unload(self):
+        self.refresh_loop.cancel()
+
+    def get_games(self):
+        games_cog = self.bot.get_cog('GameCommands')
+        if not games_cog:
+            logging.error("GameCommands cog is not loaded. Dashboard has no games to show.")
+            return []
+        return list(games_cog.games.values())
+
+
+#################
+#  STATE FILE   #
+#################
+    def load_dashboards(self):
+        """Load the guild -> dashboard message mapping from disk."""
+        if not os.path.exists(DASHBOARD_STATE_FILE):
+            return {}
+        try:
+            with open(DASHBOARD_STATE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to load dashboards from {DASHBOARD_STATE_FILE}: {e}")
+            return {}
+
+    def save_dashboards(self):
+        """Persist the guild -> dashboard message mapping to disk."""
+        try:
+            with open(DASHBOARD_STATE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.dashboards, f, indent=2)
+        except OSError as e:
+            logging.error(f"Failed to save dashboards to {DASHBOARD_STATE_FILE}: {e}")
+
+
+#################
+#   SNAPSHOT    #
+#################
+    async def collect_snapshot(self):
+        """Collect server and system state off the event loop, since the probes block.
+
+        Runs without holding refresh_lock, so a slow probe never stalls edits or commands.
+        """
+        loop = asyncio.get_running_loop()
+        collected_at = time.monotonic()
+
+        game_statuses = []
+        for game in self.get_games():
+            running = await loop.run_in_executor(None, game.is_running)
+            game_statuses.append((game.display_name, running))
+
+        cpu_usage = await loop.run_in_executor(None, get_cpu_usage)
+        memory_usage = await loop.run_in_executor(None, get_memory_usage, 0)
+
+        # The external IP rarely changes, so only ask ipify every ip_refresh_interval seconds
+        if self.external_ip is None or time.monotonic() - self.external_ip_fetched_at >= DASHBOARD_IP_REFRESH_INTERVAL:
+            external_ip = await loop.run_in_executor(None, get_external_ip)
+            # Keep showing the last known IP if the lookup failed
+            if external_ip != IP_UNAVAILABLE or self.external_ip is None:
+                self.external_ip = external_ip
+            self.external_ip_fetched_at = time.monotonic()
+
+        return {
+            'collected_at': collected_at,
+            'game_statuses': game_statuses,
+            'external_ip': self.external_ip,
+            # 5% CPU and whole GB steps so small fluctuations don't count as a change.
+            # A busy machine will still cross these steps and get an edit most ticks.
+            'cpu_usage': 5 * round(cpu_usage / 5),
+            'memory_usage': memory_usage,
+        }
+
+    def store_snapshot(self, snapshot):
+        """Keep the newest snapshot. Call with refresh_lock held."""
+        if self.snapshot is None or snapshot['collected_at'] >= self.snapshot['collected_at']:
+            self.snapshot = snapshot
+
+    def snapshot_is_stale(self):
+        return self.snapshot is None or time.monotonic() - self.snapshot['collected_at'] >= DASHBOARD_REFRESH_INTERVAL
+
+    def render_embed(self):
+        return build_status_embed(
+            self.snapshot['game_statuses'],
+            self.snapshot['external_ip'],
+            self.snapshot['cpu_usage'],
+            self.snapshot['memory_usage']
+        )
+
+    def remove_dashboard(self, guild_id):
+        """Forget a guild's dashboard. Call with refresh_lock held."""
+        record = self.dashboards.pop(guild_id, None)
+        self.last_rendered.pop(guild_id, None)
+        self.retry_at.pop(guild_id, None)
+        if record:
+            self.save_dashboards()
+        return record
+
+    def get_dashboard_message(self, record):
+        # A partial messageable needs no channel cache, so uncached threads still work
+        channel = self.bot.get_partial_messageable(record['channel_id'])
+        return channel.get_partial_message(record['message_id'])
+
+
+#################
+#    REFRESH    #
+#################
+    async def refresh_dashboards(self):
+        """Re-render from a fresh snapshot and edit each dashboard whose content has changed."""
+        if not self.dashboards:
+            return
+
+        snapshot = await self.collect_snapshot()
+
+        async with self.refresh_lock:
+            self.store_snapshot(snapshot)
+            embed = self.render_embed()
+            rendered = embed.to_dict()
+
+            for guild_id, record in list(self.dashboards.items()):
+                if self.last_rendered.get(guild_id) == rendered:
+                    continue
+                if time.monotonic() < self.retry_at.get(guild_id, 0):
+                    continue
+
+                # The first edit after startup also replaces the buttons, so they match the current games config
+                edit_kwargs = {'embed': embed}
+                if guild_id not in self.last_rendered:
+                    edit_kwargs['view'] = DashboardView(self, self.get_games())
+
+                try:
+                    # Partial message avoids a fetch
+                    await self.get_dashboard_message(record).edit(**edit_kwargs)
+                    self.last_rendered[guild_id] = rendered
+                    self.retry_at.pop(guild_id, None)
+                except discord.NotFound:
+                    logging.info(f"Dashboard message or channel for guild {guild_id} was deleted. Removing it.")
+                    self.remove_dashboard(guild_id)
+                except discord.Forbidden as e:
+                    logging.error(f"No access to the dashboard for guild {guild_id}, retrying in {DASHBOARD_RETRY_BACKOFF} seconds: {e}")
+                    self.retry_at[guild_id] = time.monotonic() + DASHBOARD_RETRY_BACKOFF
+                except discord.HTTPException as e:
+                    logging.error(f"Failed to update dashboard for guild {guild_id}: {e}")
+
+    @tasks.loop(seconds=DASHBOARD_REFRESH_INTERVAL)
+    async def refresh_loop(self):
+        try:
+            await self.refresh_dashboards()
+        except Exception as e:
+            logging.error(f"Error while refreshing dashboards: {e}")
+
+    @refresh_loop.before_loop
+    async def before_refresh_loop(self):
+        await self.bot.wait_until_ready()
+
+    async def handle_action(self, interaction, action, game_name):
+        """Run a button action. The interaction has already been deferred."""
+        if action == 'refresh':
+            record = self.dashboards.get(str(interaction.guild_id))
+            if not record or record['message_id'] != interaction.message.id:
+                await interaction.followup.send(
+                    "❌ This dashboard is no longer active. Use `!dashboard` to create a new one.", ephemeral=True
+                )
+                return
+
+        games_cog = self.bot.get_cog('GameCommands')
+        if action in ('start', 'stop') and not games_cog:
+            await interaction.followup.send("❌ Game commands are not loaded.", ephemeral=True)
+            return
+
+        try:
+            destination = InteractionDestination(interaction)
+            if action == 'start':
+                await games_cog.start_game(destination, game_name)
+            elif action == 'stop':
+                await games_cog.stop_game(destination, game_name)
+        except Exception as e:
+            logging.error(f"Error handling dashboard action '{action}' for '{game_name}': {e}")
+            await interaction.followup.send(f"❌ Error: {e}", ephemeral=True)
+
+        # Show the result straight away instead of waiting for the next tick
+        try:
+            await self.refresh_dashboards()
+        except Exception as e:
+            logging.error(f"Error while refreshing dashboards after '{action}': {e}")
+
+
+#####################
+# DASHBOARD COMMAND #
+#####################
+    @commands.group(invoke_without_command=True)
+    @commands.guild_only()
+    async def dashboard(self, ctx):
+        """Posts a pinned, auto-refreshing status dashboard in this channel."""
+        if ctx.subcommand_passed is not None:
+            await ctx.send(f"❌ Unknown dashboard command '{ctx.subcommand_passed}'. Use `!dashboard` or `!dashboard remove`.")
+            return
+
+        guild_id = str(ctx.guild.id)
+        if guild_id in self.dashboards:
+            await ctx.send("❌ This server already has a dashboard. Use `!dashboard remove` first.")
+            return
+
+        # The loop idles while there are no dashboards, so the cached snapshot may be old
+        snapshot = None
+        if not self.dashboards or self.snapshot_is_stale():
+            snapshot = await self.collect_snapshot()
+
+        async with self.refresh_lock:
+            # Check again, another !dashboard may have finished while the snapshot was collected
+            if guild_id in self.dashboards:
+                await ctx.send("❌ This server already has a dashboard. Use `!dashboard remove` first.")
+                return
+
+            if snapshot:
+                self.store_snapshot(snapshot)
+            embed = self.render_embed()
+
+            message = await ctx.send(embed=embed, view=DashboardView(self, self.get_games()))
+            self.dashboards[guild_id] = {'channel_id': ctx.channel.id, 'message_id': message.id}
+            self.last_rendered[guild_id] = embed.to_dict()
+            self.save_dashboards()
+
+        try:
+            await message.pin()
+        except discord.Forbidden:
+            await ctx.send("⚠️ Dashboard created, but I need the Manage Messages permission to pin it.")
+        except discord.HTTPException as e:
+            logging.error(f"Failed to pin dashboard in guild {guild_id}: {e}")
+
+    @dashboard.command(name='remove')
+    @commands.guild_only()
+    async def dashboard_remove(self, ctx):
+        """Removes this server's dashboard."""
+        guild_id = str(ctx.guild.id)
+        async with self.refresh_lock:
+            record = self.remove_dashboard(guild_id)
+
+        if not record:
+            await ctx.send("❌ This server has no dashboard.")
+            return
+
+        try:
+            await self.get_dashboard_message(record).delete()
+        except discord.HTTPException:
+            pass
+
+        await ctx.send("✅ Dashboard removed.")
+
+
+async def setup(bot):
+    await bot.add_cog(Dashboard(bot))
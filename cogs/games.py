@@ -14,6 +14,28 @@ import win32con
 from utils.server_info import get_external_ip, get_cpu_usage, get_memory_usage
 
 
+def build_status_embed(game_statuses, external_ip, cpu_usage, memory_usage):
+    """Build the server status embed from (display_name, is_running) pairs and system info."""
+    embed = discord.Embed(title="🖥️ Server Status", color=discord.Color.blue())
+
+    for display_name, running in game_statuses:
+        # Determine the status indicator
+        status_emoji = ":green_circle:" if running else ":red_circle:"
+        field_name = f"{status_emoji} {display_name}"
+        field_value = "\u200b"
+        embed.add_field(name=field_name, value=field_value, inline=False)
+
+    # Add system information
+    embed.add_field(name="🌐 External IP", value=external_ip, inline=True)
+    embed.add_field(name="🔐 Password", value=PASSWORD, inline=True)
+    embed.add_field(name="\u200b", value="\u200b", inline=True)
+    embed.add_field(name="🧠 CPU Usage", value=f"{cpu_usage}%", inline=True)
+    embed.add_field(name="💾 Memory Usage", value=memory_usage, inline=True)
+    embed.add_field(name="\u200b", value="\u200b", inline=True)
+
+    return embed
+
+
 class GameCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -137,6 +159,10 @@ class GameCommands(commands.Cog):
     @commands.command()
     async def start(self, ctx, game_name: str):
         """Starts the specified game server."""
+        await self.start_game(ctx, game_name)
+
+    async def start_game(self, ctx, game_name):
+        """Start logic shared by !start and the dashboard buttons. ctx only needs a send() method."""
         game = self.games.get(game_name.lower())
         if not game or not game.start_command:
             await ctx.send(f"❌ Game '{game_name}' not found or start command not configured.")
@@ -201,6 +227,10 @@ class GameCommands(commands.Cog):
     @commands.command()
     async def stop(self, ctx, game_name: str):
         """Stops the specified game server."""
+        await self.stop_game(ctx, game_name)
+
+    async def stop_game(self, ctx, game_name):
+        """Stop logic shared by !stop and the dashboard buttons. ctx only needs a send() method."""
         game = self.games.get(game_name.lower())
         if not game:
             await ctx.send(f"❌ Game '{game_name}' not found.")
@@ -365,26 +395,8 @@ class GameCommands(commands.Cog):
     @commands.command()
     async def status(self, ctx):
         """Displays the status of all game servers."""
-        embed = discord.Embed(title="🖥️ Server Status", color=discord.Color.blue())
-
-        for game in self.games.values():
-            # Determine the status indicator
-            status_emoji = ":green_circle:" if game.is_running() else ":red_circle:"
-            field_name = f"{status_emoji} {game.display_name}"
-            field_value = "\u200b"
-            embed.add_field(name=field_name, value=field_value, inline=False)
-
-        # Add system information
-        external_ip = get_external_ip()
-        cpu_usage = get_cpu_usage()
-        memory_usage = get_memory_usage()
-
-        embed.add_field(name="🌐 External IP", value=external_ip, inline=True)
-        embed.add_field(name="🔐 Password", value=PASSWORD, inline=True)
-        embed.add_field(name="\u200b", value="\u200b", inline=True)
-        embed.add_field(name="🧠 CPU Usage", value=f"{cpu_usage}%", inline=True)
-        embed.add_field(name="💾 Memory Usage", value=memory_usage, inline=True)
-        embed.add_field(name="\u200b", value="\u200b", inline=True)
+        game_statuses = [(game.display_name, game.is_running()) for game in self.games.values()]
+        embed = build_status_embed(game_statuses, get_external_ip(), get_cpu_usage(), get_memory_usage())
 
         await ctx.send(embed=embed)
 
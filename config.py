@@ -8,4 +8,10 @@ with open('config.yaml', 'r') as file:
 
 DISCORD_TOKEN = config['discord']['token']
 PASSWORD = config['password']
-INITIAL_EXTENSIONS = ['cogs.games']
+INITIAL_EXTENSIONS = ['cogs.games', 'cogs.dashboard']
+
+# Dashboard settings (optional section in config.yaml, may be left empty)
+dashboard_config = config.get('dashboard') or {}
+DASHBOARD_REFRESH_INTERVAL = dashboard_config.get('refresh_interval', 30)
+DASHBOARD_IP_REFRESH_INTERVAL = dashboard_config.get('ip_refresh_interval', 300)
+DASHBOARD_STATE_FILE = 'dashboards.json'
@@ -3,19 +3,21 @@
 import requests
 import psutil
 
+IP_UNAVAILABLE = 'Unable to fetch IP'
+
 def get_external_ip():
     try:
-        res = requests.get('https://api.ipify.org')
+        res = requests.get('https://api.ipify.org', timeout=5)
         res.raise_for_status()
         return res.text
     except requests.RequestException:
-        return 'Unable to fetch IP'
+        return IP_UNAVAILABLE
 
 def get_cpu_usage():
     return psutil.cpu_percent(interval=1)
 
-def get_memory_usage():
+def get_memory_usage(decimals=1):
     mem = psutil.virtual_memory()
     used_memory_gb = mem.used / (1024 ** 3)
     total_memory_gb = mem.total / (1024 ** 3)
-    return f"{used_memory_gb:.1f} GB / {total_memory_gb:.1f} GB"
+    return f"{used_memory_gb:.{decimals}f} GB / {total_memory_gb:.{decimals}f} GB"